@@ -1,6 +1,139 @@
+import asyncio
+import functools
+import io
+import threading
+import orjson
 import requests, sys
-from bs4 import BeautifulSoup
-from xml.etree import ElementTree
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import astuple, dataclass
+from lxml import etree, html
+from requests.adapters import HTTPAdapter
+from typing import ClassVar, NamedTuple
+from urllib3.util.retry import Retry
+
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
+
+
+# Cache lifetimes (seconds) per API host; anything not listed falls back to _CACHE_DEFAULT_TTL
+_CACHE_DEFAULT_TTL = 86400
+_CACHE_TTLS = {
+    'pubmed.ncbi.nlm.nih.gov': 3600,
+    'eutils.ncbi.nlm.nih.gov': 86400 * 7,
+    'gnomad.broadinstitute.org': 86400 * 30,
+    'rest.ensembl.org': 86400 * 30,
+    'database.liulab.science': 86400 * 30,
+    'spliceailookup-api.broadinstitute.org': 86400 * 30,
+}
+
+# Shared HTTP session so repeated calls to the same hosts reuse pooled keep-alive connections.
+# When requests-cache is installed, responses are also kept in an on-disk SQLite cache, and a
+# stale copy is served if the upstream API errors.
+if requests_cache is not None:
+    _SESSION = requests_cache.CachedSession(
+        'variant_api_cache',
+        backend='sqlite',
+        expire_after=_CACHE_DEFAULT_TTL,
+        urls_expire_after=_CACHE_TTLS,
+        allowable_methods=('GET', 'POST'),
+        stale_if_error=True
+    )
+else:
+    _SESSION = requests.Session()
+
+# HTTP/1.1 keep-alive pool. An HTTP/2 client such as httpx would bypass the requests_cache session
+# and the urllib3 Retry policy below, so pooled requests connections are used instead.
+_ADAPTER = HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=32,
+    max_retries=Retry(
+        total=4,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=['GET', 'POST'],
+        raise_on_status=False
+    )
+)
+_SESSION.mount("https://", _ADAPTER)
+_SESSION.mount("http://", _ADAPTER)
+_SESSION.headers.update({"Accept-Encoding": "gzip"})
+
+# (connect, read) timeout in seconds applied to every request so a slow API cannot stall the dashboard
+_TIMEOUT = (5, 30)
+
+
+# API endpoints and request headers shared across calls
+_SPLICEAI_BASE = "https://spliceailookup-api.broadinstitute.org/spliceai/"
+_ENSEMBL_VEP = "https://rest.ensembl.org/vep/human/hgvs/{}?"
+_JSON_HDR = {"Content-Type": "application/json", "Accept": "application/json"}
+
+
+# Result types returned by the API tools
+
+
+@dataclass(slots=True, frozen=True)
+class VepResult:
+    """Variant information extracted from the Ensembl VEP response. Missing fields are 'N/A'."""
+
+    gene_symbol: str
+    assembly_name: str
+    chromosome: str
+    genomic_start: int | str
+    genomic_end: int | str
+    most_severe_consequence: str
+    protein_start: int | str
+    protein_end: int | str
+    amino_acids: str
+
+    LABELS: ClassVar[tuple] = (
+        "Gene Symbol", "Assembly Name", "Chromosome", "Genomic Start", "Genomic End",
+        "Most Severe Consequence", "Protein Start", "Protein End", "Amino Acids"
+    )
+
+    def to_dict(self):
+        """Return the fields keyed by their display labels."""
+        return dict(zip(self.LABELS, astuple(self)))
+
+
+@dataclass(slots=True, frozen=True)
+class RevelResult:
+    """REVEL score data for a variant. Missing fields are empty strings."""
+
+    chr: str
+    pos: str
+    ref: str
+    alt: str
+    genename: str
+    ensembl_geneid: str
+    ensembl_transcriptid: str
+    ensembl_proteinid: str
+    revel_score: str
+    revel_rankscore: str
+
+
+class GnomadResult(NamedTuple):
+    """GnomAD allele counts for a variant."""
+
+    formatted_variant: str
+    genome_data: dict
+    exome_data: dict
+
+
+# Precompiled XPath selectors for the HTML scraped from PubMed and the REVEL database
+_DOCSUM_LINKS = etree.XPath('//a[contains(concat(" ", normalize-space(@class), " "), " docsum-title ")]')
+_REVEL_HEADERS = etree.XPath('.//th[contains(concat(" ", normalize-space(@class), " "), " w3-blue ")]')
+_ROW_CELLS = etree.XPath('./td | ./th')
+
+# Characters removed from an HGVS change (e.g. "c.601C>T") to build the gnomAD variant change
+_VARIANT_CHANGE_STRIP = str.maketrans('', '', '0123456789.c')
+
+# Minified gnomAD GraphQL query selecting only the genome/exome allele counts that callers use
+_GNOMAD_QUERY = (
+    "query VariantDetails($datasetId:DatasetId!,$variantId:String!)"
+    "{variant(dataset:$datasetId,variantId:$variantId){genome{ac an}exome{ac an}}}"
+)
 
 
 # First API tool
@@ -27,20 +160,17 @@ def get_splice_ai_data(variant, hg_version=38, distance=500, mask=1):
     >>>     print(splice_ai_data)
     """
     
-    # Define the base URL for the SpliceAI API
-    base_url = "https://spliceailookup-api.broadinstitute.org/spliceai/"
-    
     # Construct the URL with query parameters
-    url = f"{base_url}?hg={hg_version}&distance={distance}&mask={mask}&variant={variant}"
+    url = f"{_SPLICEAI_BASE}?hg={hg_version}&distance={distance}&mask={mask}&variant={variant}"
     
     try:
         # Send a GET request to the SpliceAI API
-        response = requests.get(url, verify=False)
+        response = _SESSION.get(url, timeout=_TIMEOUT)
         
         # Check if the request was successful (status code 200)
         if response.status_code == 200:
             # Parse the JSON response
-            data = response.json()
+            data = orjson.loads(response.content)
             
             # Return the parsed data
             return data
@@ -57,6 +187,22 @@ def get_splice_ai_data(variant, hg_version=38, distance=500, mask=1):
 # Next API tool
 
 
+def _first_text(xml_bytes, tag):
+    """
+    Stream through an XML document and return the text of the first element with the given tag.
+
+    Parameters:
+    - xml_bytes (bytes): The raw XML response body.
+    - tag (str): The element tag to look for.
+
+    Returns:
+    - str or None: The element text, or None if no such element is found.
+    """
+    for _, element in etree.iterparse(io.BytesIO(xml_bytes), events=("end",), tag=tag):
+        return element.text
+    return None
+
+
 def get_clinvar_classification(variant):
     """
     Get clinical information for a given variant using two NCBI ClinVar API calls.
@@ -84,39 +230,76 @@ def get_clinvar_classification(variant):
     print(f"Review status is: {review_status}")
     """
 
-    # Step 1: Search in the first API to get the variant ID
-    search_url = f"https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esearch.fcgi?db=clinvar&term={variant}"
-    search_response = requests.get(search_url)
-    
-    # Parse the XML response to get the variant ID
-    root = ElementTree.fromstring(search_response.content)
-    id_element = root.find('.//Id')
-    
-    if id_element is None:
-        print("Variant not found in the first API.")
-        return None
-    
-    variant_id = id_element.text
+    return get_clinvar_classifications([variant])[variant]
 
-    # Step 2: Use the obtained variant ID to search in the second API
-    summary_url = f"https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esummary.fcgi?db=clinvar&id={variant_id}"
-    summary_response = requests.get(summary_url)
 
-    # Parse the XML response to get the clinical significance and review status
-    root = ElementTree.fromstring(summary_response.content)
-    description_element = root.find('.//description')
-    review_status_element = root.find('.//review_status')
+def get_clinvar_classifications(variants):
+    """
+    Get clinical information for several variants, sharing a single ClinVar summary request.
 
-    if description_element is None:
-        print("Clinical significance not found in the second API.")
-        return None
+    Parameters:
+    - variants (list of str): The variants to search for.
 
-    # Extract clinical significance and review status
-    clinical_significance = description_element.text
-    review_status = review_status_element.text
-    link = f"https://www.ncbi.nlm.nih.gov/clinvar/{variant_id}"
-    
-    return clinical_significance, review_status, link
+    Returns:
+    - dict: Maps each variant to a tuple of (clinical significance, review status, ClinVar link),
+      or to None if the variant or its clinical significance is not found.
+
+    Each variant is searched in the first API to obtain its unique ID, then the summaries for all
+    found IDs are fetched from the second API in one request, so N variants cost N + 1 calls
+    rather than 2N.
+
+    Example usage:
+    variants = ["NM_000516.7:c.601C>T", "NM_015450.3(POT1):c.1071dup (p.Gln358fs)"]
+    for variant, result in get_clinvar_classifications(variants).items():
+        if result is not None:
+            clinical_significance, review_status, link = result
+    """
+    results = dict.fromkeys(variants)
+
+    # Step 1: Search in the first API to get each variant ID
+    variant_ids = {}
+    for variant in results:
+        search_url = f"https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esearch.fcgi?db=clinvar&term={variant}"
+        search_response = _SESSION.get(search_url, timeout=_TIMEOUT)
+
+        # Parse the XML response to get the variant ID
+        variant_id = _first_text(search_response.content, 'Id')
+
+        if variant_id is None:
+            print(f"Variant not found in the first API: {variant}")
+            continue
+
+        variant_ids[variant] = variant_id
+
+    if not variant_ids:
+        return results
+
+    # Step 2: Use the obtained variant IDs to search in the second API with a single request
+    summary_url = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esummary.fcgi"
+    form_data = {
+        'db': 'clinvar',
+        'id': ','.join(dict.fromkeys(variant_ids.values())),
+        'retmode': 'json'
+    }
+    summary_response = _SESSION.post(summary_url, data=form_data, timeout=_TIMEOUT)
+    summaries = orjson.loads(summary_response.content).get('result', {})
+
+    # Extract the clinical significance and review status for each variant
+    for variant, variant_id in variant_ids.items():
+        summary = summaries.get(variant_id, {})
+        classification = summary.get('germline_classification') or summary.get('clinical_significance') or {}
+        clinical_significance = classification.get('description')
+
+        if not clinical_significance:
+            print(f"Clinical significance not found in the second API: {variant}")
+            continue
+
+        review_status = classification.get('review_status')
+        link = f"https://www.ncbi.nlm.nih.gov/clinvar/{variant_id}"
+
+        results[variant] = clinical_significance, review_status, link
+
+    return results
 
 
 # Next API tool
@@ -146,22 +329,22 @@ def search_pubmed(query):
 
     try:
         # Send a GET request to the PubMed search URL
-        response = requests.get(url)
+        response = _SESSION.get(url, timeout=_TIMEOUT)
         
         # Check if the request was successful (status code 200)
         if response.status_code == 200:
             # Parse the HTML content of the response
-            soup = BeautifulSoup(response.text, "html.parser")
+            tree = html.fromstring(response.content)
             
             # Find all search result links
-            search_results = soup.find_all("a", class_="docsum-title")
+            search_results = _DOCSUM_LINKS(tree)
 
             if search_results:
                 result_links = []
                 # Iterate through the search results and construct links for each
                 for result in search_results:
-                    paper_url = base_url + result["href"]
-                    paper_title = result.text
+                    paper_url = base_url + result.get("href")
+                    paper_title = result.text_content().strip()
                     result_links.append(f'<a href="{paper_url}" target="_blank">{paper_title}</a>')
                 return result_links
             else:
@@ -199,7 +382,7 @@ def get_varsome_data_url(variant, assembly='hg38', annotation_mode='somatic'):
         api_url = f"https://varsome.com/variant/{variant_id}?annotation-mode={annotation_mode}"
 
         # Make the GET request
-        response = requests.get(api_url)
+        response = _SESSION.get(api_url, timeout=_TIMEOUT)
 
         # Check if the request was successful (status code 200)
         if response.status_code == 200:
@@ -221,13 +404,13 @@ def get_varsome_data_url(variant, assembly='hg38', annotation_mode='somatic'):
 
 def get_revel_score(input_data_string):
     """
-    Retrieves REVEL score data from an online database using two API calls.
+    Retrieves REVEL score data from an online database using a single API call.
 
     Parameters:
     - input_data_string (str): Input data string of the format 'chr-pos-ref-alt'.
 
     Returns:
-    - dict or None: A dictionary containing the REVEL score data if available, or None if no data is retrieved.
+    - RevelResult or None: The REVEL score data if available, or None if no data is retrieved.
 
     Example Usage:
     input_data_string = '7-124842898-G-T'
@@ -256,20 +439,10 @@ def get_revel_score(input_data_string):
         'Ensembl_transcriptid': ''
     }
 
-    # Define the URLs for the API calls
-    url_select = "http://database.liulab.science/aSelect"
+    # Define the URL for the API call
     url_query = "http://database.liulab.science/SingleQuery"
 
-    # Define the form data for the first API call
-    form_data_select = {
-        "range": "hg38",
-        "selectBasicInfoA": "chr, pos, ref, alt, aaref, aaalt, rs_dbSNP, hg19_chr, hg19_pos, hg18_chr, hg18_pos, aapos, genename, Ensembl_geneid, Ensembl_transcriptid, Ensembl_proteinid, REVEL_score, REVEL_rankscore"
-    }
-
-    # Send a POST request for the first API call
-    _ = requests.post(url_select, data=form_data_select)
-
-    # Define the form data for the second API call
+    # Define the form data for the API call
     form_data_query = {
         'chr': input_data['chr'],
         'pos': input_data['pos'],
@@ -280,8 +453,8 @@ def get_revel_score(input_data_string):
         'Ensembl_transcriptid': input_data['Ensembl_transcriptid']
     }
 
-    # Send a POST request for the second API call
-    response = requests.post(url_query, data=form_data_query)
+    # Send a POST request for the API call
+    response = _SESSION.post(url_query, data=form_data_query, timeout=_TIMEOUT)
 
     # Check if the request was successful (status code 200)
     if response.status_code != 200:
@@ -289,37 +462,105 @@ def get_revel_score(input_data_string):
         print(f"Error: {response.status_code}")
         return None
 
-    # The HTML content retrieved from the API response
-    html_content = response.text
-
-    # Parse the HTML content with BeautifulSoup
-    soup = BeautifulSoup(html_content, 'lxml')
+    # Parse the HTML content retrieved from the API response
+    tree = html.fromstring(response.content)
 
     # Find the table in the HTML (assuming there's only one table, adjust if needed)
-    table = soup.find('table')
+    table = tree.find('.//table')
+    if table is None:
+        return None
 
     # Extract table headers
-    headers = [header.text.strip() for header in table.find_all('th', class_='w3-blue')]
+    headers = [header.text_content().strip() for header in _REVEL_HEADERS(table)]
 
     # Extract table rows
     rows = []
-    for row in table.find_all('tr'):
-        data = [cell.text.strip() for cell in row.find_all(['td', 'th'])]
+    for row in table.iterfind('.//tr'):
+        data = [cell.text_content().strip() for cell in _ROW_CELLS(row)]
         rows.append(dict(zip(headers, data)))
 
     # Remove the first row (header row) as it is already included in the headers
     rows = rows[1:]
 
     # Return the first row of data if available, otherwise, return None
-    return rows[0] if rows else None
+    if not rows:
+        return None
 
+    row = rows[0]
+    return RevelResult(
+        chr=row.get('chr', ''),
+        pos=row.get('pos', ''),
+        ref=row.get('ref', ''),
+        alt=row.get('alt', ''),
+        genename=row.get('genename', ''),
+        ensembl_geneid=row.get('Ensembl_geneid', ''),
+        ensembl_transcriptid=row.get('Ensembl_transcriptid', ''),
+        ensembl_proteinid=row.get('Ensembl_proteinid', ''),
+        revel_score=row.get('REVEL_score', ''),
+        revel_rankscore=row.get('REVEL_rankscore', '')
+    )
 
 
-# Next API tool
+
+# Ensembl VEP request shared by the gnomAD and Ensembl tools
 
 
-import requests
-import sys
+# One lock per HGVS variant with a VEP request in flight, guarded by _VEP_LOCKS_GUARD
+_VEP_LOCKS = {}
+_VEP_LOCKS_GUARD = threading.Lock()
+
+
+def _fetch_vep(hgvs_variant):
+    """
+    Query the Ensembl Variant Effect Predictor (VEP) once per HGVS variant.
+
+    The gnomAD, functional, REST and genomic coordinate tools all read fields from this
+    same response, so it is fetched once and cached for reuse. Concurrent callers asking
+    for the same variant wait for the first request instead of sending their own.
+
+    Parameters:
+    - hgvs_variant (str): HGVS notation for the variant.
+
+    Returns:
+    - list: The decoded VEP JSON response. Callers must not modify it.
+    """
+    with _VEP_LOCKS_GUARD:
+        lock = _VEP_LOCKS.setdefault(hgvs_variant, threading.Lock())
+
+    try:
+        with lock:
+            return _request_vep(hgvs_variant)
+    finally:
+        # Once the response is cached, later callers no longer need the lock
+        with _VEP_LOCKS_GUARD:
+            _VEP_LOCKS.pop(hgvs_variant, None)
+
+
+@functools.lru_cache(maxsize=512)
+def _request_vep(hgvs_variant):
+    """
+    Send the VEP request for an HGVS variant and cache the decoded response.
+
+    Parameters:
+    - hgvs_variant (str): HGVS notation for the variant.
+
+    Returns:
+    - list: The decoded VEP JSON response.
+    """
+    # Make a GET request to the Ensembl REST API
+    r = _SESSION.get(_ENSEMBL_VEP.format(hgvs_variant), headers=_JSON_HDR, timeout=_TIMEOUT)
+
+    # Check if the request was successful
+    if not r.ok:
+        r.raise_for_status()
+        sys.exit()
+
+    # Parse the JSON response
+    return orjson.loads(r.content)
+
+
+# Next API tool
+
 
 def get_gnomad_data(hgvs_variant):
     """
@@ -329,7 +570,7 @@ def get_gnomad_data(hgvs_variant):
     - hgvs_variant (str): HGVS notation for the variant.
 
     Returns:
-    - Tuple containing:
+    - GnomadResult (named tuple) containing:
         - formatted_variant (str): Formatted variant for GnomAD search.
         - genome_data (dict): GnomAD genome data.
         - exome_data (dict): GnomAD exome data.
@@ -342,23 +583,12 @@ def get_gnomad_data(hgvs_variant):
     """
     
     # Ensembl API to get genomic coordinates
-    server = "https://rest.ensembl.org"
-    ext = f"/vep/human/hgvs/{hgvs_variant}?"
-
-    r = requests.get(server + ext, headers={"Content-Type": "application/json"})
-
-    if not r.ok:
-        r.raise_for_status()
-        sys.exit()
-
-    decoded = r.json()
+    decoded = _fetch_vep(hgvs_variant)
 
     if len(decoded) >= 1 and 'transcript_consequences' in decoded[0]:
         first_transcript_consequence = decoded[0]['transcript_consequences'][0]
 
-        variant_change = hgvs_variant.split(":")[-1]
-        variant_change = ''.join(c for c in variant_change if not c.isdigit() and c not in ['.', 'c'])
-        variant_change = variant_change.replace(">", "-")
+        variant_change = hgvs_variant.rpartition(":")[2].translate(_VARIANT_CHANGE_STRIP).replace(">", "-")
 
         result = {
             "Chromosome": decoded[0].get('seq_region_name', 'N/A'),
@@ -373,34 +603,17 @@ def get_gnomad_data(hgvs_variant):
         api_url = "https://gnomad.broadinstitute.org/api/"
 
         query_params = {
-            "query": """
-                query VariantDetails($datasetId: DatasetId!, $variantId: String!) {
-                    variant(dataset: $datasetId, variantId: $variantId) {
-                        pos
-                        ref
-                        alt
-                        rsid
-                        genome {
-                            ac
-                            an
-                        }
-                        exome {
-                            ac
-                            an
-                        }
-                    }
-                }
-            """,
+            "query": _GNOMAD_QUERY,
             "variables": {
                 "datasetId": "gnomad_r4",
                 "variantId": formatted_variant
             }
         }
 
-        response = requests.post(api_url, json=query_params)
+        response = _SESSION.post(api_url, json=query_params, timeout=_TIMEOUT)
 
         if response.status_code == 200:
-            data = response.json()
+            data = orjson.loads(response.content)
             genome_data = data["data"]["variant"]["genome"]
             exome_data = data["data"]["variant"]["exome"]
 
@@ -420,7 +633,7 @@ def get_gnomad_data(hgvs_variant):
             gnomad_link = f"\nGnomAD Link: https://gnomad.broadinstitute.org/variant/{formatted_variant}"
             print(gnomad_link)
 
-            return formatted_variant, genome_data, exome_data
+            return GnomadResult(formatted_variant, genome_data, exome_data)
         else:
             print(f"Error: Unable to retrieve data from GnomAD API.")
             return None
@@ -443,20 +656,8 @@ def get_ensembl_functional_data(hgvs_variant):
     >>> hgvs_variant = "NM_000516.7:c.601C>T"
     >>> get_ensembl_functional_data(hgvs_variant)
     """
-    # Define the Ensembl server and endpoint for the Variant Effect Predictor (VEP)
-    server = "https://rest.ensembl.org"
-    ext = f"/vep/human/hgvs/{hgvs_variant}?"
-
-    # Make a GET request to the Ensembl REST API
-    r = requests.get(server + ext, headers={"Content-Type": "application/json"})
-
-    # Check if the request was successful
-    if not r.ok:
-        r.raise_for_status()
-        sys.exit()
-
-    # Parse the JSON response
-    decoded = r.json()
+    # Get the (shared) decoded response from the Ensembl Variant Effect Predictor (VEP)
+    decoded = _fetch_vep(hgvs_variant)
 
     # Check if there is at least one item in the response and if 'transcript_consequences' is present
     if len(decoded) >= 1 and 'transcript_consequences' in decoded[0]:
@@ -493,26 +694,14 @@ def get_ensembl_rest_data(hgvs_variant):
     - hgvs_variant (str): HGVS notation for the variant.
 
     Returns:
-    - dict: Dictionary containing information about the variant.
+    - VepResult: Information about the variant (use to_dict() for display labels), or None.
 
     Example:
     >>> hgvs_variant = "NM_000516.7:c.601C>T"
     >>> get_ensembl_rest_data(hgvs_variant)
     """
-    # Define the Ensembl server and endpoint for the Variant Effect Predictor (VEP)
-    server = "https://rest.ensembl.org"
-    ext = f"/vep/human/hgvs/{hgvs_variant}?"
-
-    # Make a GET request to the Ensembl REST API
-    r = requests.get(server + ext, headers={"Content-Type": "application/json"})
-
-    # Check if the request was successful
-    if not r.ok:
-        r.raise_for_status()
-        sys.exit()
-
-    # Parse the JSON response
-    decoded = r.json()
+    # Get the (shared) decoded response from the Ensembl Variant Effect Predictor (VEP)
+    decoded = _fetch_vep(hgvs_variant)
 
     # Check if there is at least one item in the response and if 'transcript_consequences' is present
     if len(decoded) >= 1 and 'transcript_consequences' in decoded[0]:
@@ -522,22 +711,22 @@ def get_ensembl_rest_data(hgvs_variant):
         # Extract gene symbol from 'transcript_consequence'
         gene_symbol = first_transcript_consequence.get('gene_symbol', 'N/A')
 
-        # Return information about the variant as a dictionary
-        result = {
-            "Gene Symbol": gene_symbol,
-            "Assembly Name": decoded[0].get('assembly_name', 'N/A'),
-            "Chromosome": decoded[0].get('seq_region_name', 'N/A'),
-            "Genomic Start": decoded[0].get('start', 'N/A'),
-            "Genomic End": decoded[0].get('end', 'N/A'),
-            "Most Severe Consequence": decoded[0].get('most_severe_consequence', 'N/A'),
-            "Protein Start": first_transcript_consequence.get('protein_start', 'N/A'),
-            "Protein End": first_transcript_consequence.get('protein_end', 'N/A'),
-            "Amino Acids": first_transcript_consequence.get('amino_acids', 'N/A')
-        }
+        # Return information about the variant
+        result = VepResult(
+            gene_symbol=gene_symbol,
+            assembly_name=decoded[0].get('assembly_name', 'N/A'),
+            chromosome=decoded[0].get('seq_region_name', 'N/A'),
+            genomic_start=decoded[0].get('start', 'N/A'),
+            genomic_end=decoded[0].get('end', 'N/A'),
+            most_severe_consequence=decoded[0].get('most_severe_consequence', 'N/A'),
+            protein_start=first_transcript_consequence.get('protein_start', 'N/A'),
+            protein_end=first_transcript_consequence.get('protein_end', 'N/A'),
+            amino_acids=first_transcript_consequence.get('amino_acids', 'N/A')
+        )
 
         # Print the result for demonstration
         print("Ensembl Data:")
-        for key, value in result.items():
+        for key, value in result.to_dict().items():
             print(f"{key}: {value}")
 
         return result
@@ -587,34 +776,17 @@ def get_genomic_coordinates(hgvs_variant):
     {'Chromosome': '<Chromosome>', 'Start': '<Start>', 'VariantChange': '<VariantChange>'}
     """
 
-    # Define the Ensembl server and endpoint for the Variant Effect Predictor (VEP)
-    server = "https://rest.ensembl.org"
-    ext = f"/vep/human/hgvs/{hgvs_variant}?"
-
-    # Make a GET request to the Ensembl REST API
-    r = requests.get(server + ext, headers={"Content-Type": "application/json"})
-
-    # Check if the request was successful
-    if not r.ok:
-        r.raise_for_status()
-        sys.exit()
-
-    # Parse the JSON response
-    decoded = r.json()
+    # Get the (shared) decoded response from the Ensembl Variant Effect Predictor (VEP)
+    decoded = _fetch_vep(hgvs_variant)
 
     # Check if there is at least one item in the response and if 'transcript_consequences' is present
     if len(decoded) >= 1 and 'transcript_consequences' in decoded[0]:
         # Extract information from the first item in the 'transcript_consequences' list
         first_transcript_consequence = decoded[0]['transcript_consequences'][0]
 
-        # Extract the C>T part from the HGVS variant
-        variant_change = hgvs_variant.split(":")[-1]
-
-        # Remove any numeric characters, "c.", and the lowercase 'c'
-        variant_change = ''.join(c for c in variant_change if not c.isdigit() and c not in ['.', 'c'])
-
-        # Replace ">" with "-"
-        variant_change = variant_change.replace(">", "-")
+        # Extract the C>T part from the HGVS variant, remove any numeric characters, "c.", and the
+        # lowercase 'c', then replace ">" with "-"
+        variant_change = hgvs_variant.rpartition(":")[2].translate(_VARIANT_CHANGE_STRIP).replace(">", "-")
 
         # Return information about the variant as a dictionary
         result = {
@@ -630,4 +802,164 @@ def get_genomic_coordinates(hgvs_variant):
     else:
         # If there is not enough information in the response or the structure is not as expected, print a message
         print("Not enough information in the response or structure is not as expected.")
-        return None
\ No newline at end of file
+        return None
+
+
+
+# Concurrent per-variant lookup
+
+
+def _bundle_calls(variant, hgvs_variant):
+    """
+    Map each per-variant lookup in a bundle to its API tool and argument.
+
+    Parameters:
+    - variant (str): Variant in the format "chromosome-position-reference-alternate".
+    - hgvs_variant (str): The same variant in HGVS notation.
+
+    Returns:
+    - dict: (function, argument) pairs keyed by source name.
+    """
+    return {
+        'splice': (get_splice_ai_data, variant),
+        'clinvar': (get_clinvar_classification, hgvs_variant),
+        'pubmed': (search_pubmed, hgvs_variant),
+        'varsome': (get_varsome_data_url, hgvs_variant),
+        'revel': (get_revel_score, variant),
+        'gnomad': (get_gnomad_data, hgvs_variant),
+        'ensembl': (get_ensembl_rest_data, hgvs_variant),
+    }
+
+
+async def fetch_variant_bundle(variant, hgvs_variant):
+    """
+    Run the per-variant API lookups concurrently and collect their results.
+
+    Parameters:
+    - variant (str): Variant in the format "chromosome-position-reference-alternate" (e.g., "8-140300616-T-G").
+    - hgvs_variant (str): The same variant in HGVS notation (e.g., "NM_000516.7:c.601C>T").
+
+    Returns:
+    - dict: Results keyed by source ('splice', 'clinvar', 'pubmed', 'varsome', 'revel', 'gnomad', 'ensembl').
+      A lookup that raised is returned as its exception instead of aborting the others.
+
+    Example:
+    >>> bundle = asyncio.run(fetch_variant_bundle("8-140300616-T-G", "NM_000516.7:c.601C>T"))
+    >>> print(bundle['clinvar'])
+    """
+    # The wrappers are blocking, so run each in a worker thread sharing the pooled session
+    return await _run_calls(_bundle_calls(variant, hgvs_variant))
+
+
+def fetch_variant_bundle_threaded(variant, hgvs_variant, max_workers=8):
+    """
+    Thread-pool counterpart of fetch_variant_bundle for callers that cannot run an event loop.
+
+    Parameters:
+    - variant (str): Variant in the format "chromosome-position-reference-alternate" (e.g., "8-140300616-T-G").
+    - hgvs_variant (str): The same variant in HGVS notation (e.g., "NM_000516.7:c.601C>T").
+    - max_workers (int, optional): Number of worker threads (default is 8).
+
+    Returns:
+    - dict: Results keyed by source, as returned by fetch_variant_bundle.
+
+    Example:
+    >>> bundle = fetch_variant_bundle_threaded("8-140300616-T-G", "NM_000516.7:c.601C>T")
+    >>> print(bundle['revel'])
+    """
+    calls = _bundle_calls(variant, hgvs_variant)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {name: executor.submit(func, arg) for name, (func, arg) in calls.items()}
+
+    # Match fetch_variant_bundle by returning a failed lookup's exception instead of raising it
+    return {name: future.exception() or future.result() for name, future in futures.items()}
+
+
+# Batch annotation
+
+
+# Sources in a bundle, in the order their columns are added by annotate_variants
+_BUNDLE_SOURCES = ('splice', 'clinvar', 'pubmed', 'varsome', 'revel', 'gnomad', 'ensembl')
+
+
+async def _run_calls(calls):
+    """
+    Run (function, argument) pairs concurrently in worker threads.
+
+    Parameters:
+    - calls (dict): (function, argument) pairs keyed by source name.
+
+    Returns:
+    - dict: Results keyed by source name, with a failed lookup's exception in place of its result.
+    """
+    results = await asyncio.gather(
+        *(asyncio.to_thread(func, arg) for func, arg in calls.values()),
+        return_exceptions=True
+    )
+    return dict(zip(calls, results))
+
+
+async def _gather_bundles(variant_pairs):
+    """
+    Fetch the bundles for several (variant, hgvs_variant) pairs concurrently.
+
+    ClinVar is looked up for all the HGVS variants with a single batched call to
+    get_clinvar_classifications rather than once per pair.
+
+    Parameters:
+    - variant_pairs (list of tuple): (variant, hgvs_variant) pairs to look up.
+
+    Returns:
+    - list of dict: One bundle per pair, in the same order.
+    """
+    pair_calls = []
+    for variant, hgvs_variant in variant_pairs:
+        calls = _bundle_calls(variant, hgvs_variant)
+        del calls['clinvar']
+        pair_calls.append(calls)
+
+    hgvs_variants = list(dict.fromkeys(hgvs_variant for _, hgvs_variant in variant_pairs))
+    clinvar, *bundles = await asyncio.gather(
+        asyncio.to_thread(get_clinvar_classifications, hgvs_variants),
+        *(_run_calls(calls) for calls in pair_calls),
+        return_exceptions=True
+    )
+
+    # Add each pair's ClinVar result, or the batch's exception if the batched lookup failed
+    for (_, hgvs_variant), bundle in zip(variant_pairs, bundles):
+        bundle['clinvar'] = clinvar if isinstance(clinvar, Exception) else clinvar[hgvs_variant]
+
+    return bundles
+
+
+def annotate_variants(df, variant_col, hgvs_col):
+    """
+    Annotate every row of a DataFrame of variants, looking up each distinct variant only once.
+
+    Parameters:
+    - df (pandas.DataFrame): DataFrame with one variant per row.
+    - variant_col (str): Column holding variants in the format "chromosome-position-reference-alternate".
+    - hgvs_col (str): Column holding the same variants in HGVS notation.
+
+    Returns:
+    - pandas.DataFrame: A copy of df with one added column per bundle source
+      ('splice', 'clinvar', 'pubmed', 'varsome', 'revel', 'gnomad', 'ensembl').
+
+    Must be called from synchronous code, as it runs its own event loop.
+
+    Example:
+    >>> df = pd.DataFrame({"variant": ["7-124842898-G-T"], "hgvs": ["NM_000516.7:c.601C>T"]})
+    >>> annotated = annotate_variants(df, "variant", "hgvs")
+    """
+    row_keys = list(zip(df[variant_col], df[hgvs_col]))
+
+    # Deduplicate the variants and fetch each distinct one once, concurrently
+    unique_keys = list(dict.fromkeys(row_keys))
+    bundles = asyncio.run(_gather_bundles(unique_keys)) if unique_keys else []
+    lookup = dict(zip(unique_keys, bundles))
+
+    # Join the results back onto the rows
+    columns = {name: [lookup[key][name] for key in row_keys] for name in _BUNDLE_SOURCES}
+
+    return df.assign(**columns)
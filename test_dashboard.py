@@ -1,55 +1,202 @@
 import streamlit as st
-import base64
-import pandas as pd
-from tabulate import tabulate
-from API_Toolkit import get_splice_ai_data, get_clinvar_classification, search_pubmed, get_varsome_data_url, get_revel_score, get_gnomad_data, get_ensembl_rest_data, get_ensembl_functional_data, get_genomic_coordinates
+from concurrent.futures import ThreadPoolExecutor
 
-primaryColor="red"
-backgroundColor="red"
-secondaryBackgroundColor="#0000FF"
-textColor="#262730"
-font="sans serif"
+# Page settings; the theme and server options are set in .streamlit/config.toml
+st.set_page_config(page_title="SVID", layout="wide", initial_sidebar_state="expanded")
+
+# Training cases shown on the training page: (image path, case description)
+CASES = [
+    ('./TNGS_case1.png', "New diagnosis of acute myeloid leukaemia. Custom NGS panel revealed a variant."),
+    ('./TNGS_case2.png', "Diagnosis of moderately differentiated colorectal adenocarcinoma with suspected liver metastases seen on imaging."),
+    ('./TNGS_case3.png', "Mucinous carcinoma involving both ovaries. Fallopian tube surface involvement present. Metastatic adenocarcinoma to omentum (56mm deposit).")
+]
+
+_CASE_TEMPLATE = """
+    <div style='background-color: #001f3f; padding: 10px; border-radius: 5px; text-align: center;'>
+        <p style='color: #ffffff;'>
+            Case {number}:<br>
+            {caption}
+        </p>
+    </div>
+"""
+
+# Static HTML/markdown blocks for the title and training case pages
+_INTRO_MD = """
+    This dashboard enables analysis of somatic variants. 
+    It includes summary data, in silico predictions, case/control frequencies, literature search and an area for training cases to practice classification.
+    Explore the different pages to access specific features and information.
+"""
+
+_SPACER_HTML = "<br><br>"
+
+_NAVY_BOX_HTML = """
+    <div style='background-color: #001f3f; padding: 10px; border-radius: 5px;'>
+        <p style='color: #ffffff;'>The tools throughout this dashboard can be used along with various guideline to aid interpretation of the pathogenicity of variants.</p>
+    </div>
+"""
+
+_GREY_BOX_HTML = """
+    <div style='background-color: #f2f2f2; padding: 10px; border-radius: 5px; color: #000000;'>
+        <p>The ACGS provides guidelines for the classification of somatic variants in rare disease and cancer.</p>
+    </div>
+"""
+
+_ANSWERS_HTML = """
+    <div style='background-color: #f2f2f2; padding: 10px; border-radius: 5px; color: #000000;'>
+        <p>Case 1:<br>
+        Answer:<br><br>
+        Case 2:<br>
+        Answer:<br><br>
+        Case 3:<br>
+        Answer:</p>
+    </div>
+"""
+
+# API_Toolkit (and its HTTP and parsing dependencies) is only imported once a lookup is made,
+# so the pages that make no lookups do not pay for it at startup
+def _api():
+    import API_Toolkit
+    return API_Toolkit
+
+# Cached API lookups, so Streamlit reruns reuse earlier results instead of repeating the requests
+@st.cache_data(ttl=86400, show_spinner=False)
+def _cached_ensembl(term):
+    return _api().get_ensembl_rest_data(term)
+
+@st.cache_data(ttl=86400, show_spinner=False)
+def _cached_coordinates(term):
+    return _api().get_genomic_coordinates(term)
+
+@st.cache_data(ttl=86400, show_spinner=False)
+def _cached_ensembl_functional(term):
+    return _api().get_ensembl_functional_data(term)
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _cached_clinvar(term):
+    return _api().get_clinvar_classification(term)
+
+@st.cache_data(ttl=86400, show_spinner=False)
+def _cached_varsome(term):
+    return _api().get_varsome_data_url(term)
+
+@st.cache_data(ttl=86400, show_spinner=False)
+def _cached_splice_ai(variant):
+    return _api().get_splice_ai_data(variant)
+
+@st.cache_data(ttl=86400, show_spinner=False)
+def _cached_revel(variant):
+    return _api().get_revel_score(variant)
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _cached_gnomad(term):
+    return _api().get_gnomad_data(term)
+
+@st.cache_data(ttl=1800, max_entries=256, show_spinner="Searching PubMed...")
+def _cached_pubmed(query):
+    return _api().search_pubmed(query)
+
+# Image files read once per process rather than on every rerun
+@st.cache_resource
+def _read_image(path):
+    with open(path, 'rb') as f:
+        return f.read()
+
+# Run independent API lookups at the same time; a lookup that fails is reported and returns None.
+# Also returns whether any lookup failed, since a None result can be a normal "not found".
+def _fetch_concurrently(*calls):
+    with ThreadPoolExecutor(max_workers=len(calls)) as executor:
+        futures = [executor.submit(func, arg) for func, arg in calls]
+
+    results = []
+    failed = False
+    for future in futures:
+        error = future.exception()
+        if error is not None:
+            st.error(f"Lookup failed: {error}")
+            results.append(None)
+            failed = True
+        else:
+            results.append(future.result())
+    return results, failed
 
 # Function to render title page
 def render_page1():
-    st.image('./SVID_image2.png')
+    st.image(_read_image('./SVID_image2.png'))
     st.title("Somatic Variant Interpretation Dashboard")
     st.write(" ")
   
       # Add a box with descriptive text
-    st.markdown("""
-        This dashboard enables analysis of somatic variants. 
-        It includes summary data, in silico predictions, case/control frequencies, literature search and an area for training cases to practice classification.
-        Explore the different pages to access specific features and information.
-    """)
+    st.markdown(_INTRO_MD)
 
     # Add some blank space 
-    st.markdown("<br><br>", unsafe_allow_html=True)
+    st.markdown(_SPACER_HTML, unsafe_allow_html=True)
 
     # Add a navy box with descriptive text
-    st.markdown("""
-        <div style='background-color: #001f3f; padding: 10px; border-radius: 5px;'>
-            <p style='color: #ffffff;'>The tools throughout this dashboard can be used along with various guideline to aid interpretation of the pathogenicity of variants.</p>
-        </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_NAVY_BOX_HTML, unsafe_allow_html=True)
 
     # Add some blank space before the columns
-    st.markdown("<br><br>", unsafe_allow_html=True)
+    st.markdown(_SPACER_HTML, unsafe_allow_html=True)
 
      # Create a Streamlit row layout
     col1, col2 = st.columns([2, 1])  # Adjust the ratio as needed
     
     # Add a grey box with descriptive text in the left column
     with col1:
-         st.markdown("""
-        <div style='background-color: #f2f2f2; padding: 10px; border-radius: 5px; color: #000000;'>
-            <p>The ACGS provides guidelines for the classification of somatic variants in rare disease and cancer.</p>
-        </div>
-""", unsafe_allow_html=True)
+        st.markdown(_GREY_BOX_HTML, unsafe_allow_html=True)
 
     with col2:
         # Insert an image below the text
-        st.image('./ACGS2.png', width=200)
+        st.image(_read_image('./ACGS2.png'), width=200)
+
+
+# Return the last lookup stored under the given key if it was for this input, otherwise None
+def _last_lookup(state_key, term):
+    last = st.session_state.get(state_key)
+    if last is not None and last[0] == term:
+        return last[1]
+    return None
+
+
+# Return the last looked-up term for a page, so its input (cleared when navigating away) is restored on return
+def _last_term(state_key, default=""):
+    last = st.session_state.get(state_key)
+    return last[0] if last is not None else default
+
+
+# Return True if the lookups for this input need fetching: they were never stored, or one of them raised.
+# st.cache_data does not cache a lookup that raised, so a refetch only repeats the failed requests.
+def _needs_fetch(state_key, term):
+    last = st.session_state.get(state_key)
+    return last is None or last[0] != term or last[2]
+
+
+# Display the summary data results
+def _render_summary(ensembl_data, genomic_coordinates, clinvar_data, varsome_url):
+    st.subheader("Ensembl")
+    if ensembl_data:
+        st.json(ensembl_data.to_dict())
+    else:
+        st.warning("Not enough information in the Ensembl response or structure is not as expected.")
+    if genomic_coordinates:
+        st.write("GRCh38 Genomic Coordinates: " f"{genomic_coordinates.get('Chromosome', 'N/A')}-{genomic_coordinates.get('Start', 'N/A')}-{genomic_coordinates.get('VariantChange', 'N/A')}")
+    else:
+        st.warning("Not enough information in the genomic coordinates response or structure is not as expected.")
+
+
+    st.subheader("ClinVar Classification")
+    if clinvar_data:
+        clinical_significance, review_status, link = clinvar_data
+        st.write(f"Clinical Significance: {clinical_significance}")
+        st.write(f"Review Status: {review_status}")
+        st.write(f"ClinVar Search: {link}")
+    else:
+        st.warning("Clinical significance not found or variant not found in ClinVar.")
+
+    st.subheader("Varsome")
+    if varsome_url:
+        st.markdown(f"[Link to Varsome Classification]({varsome_url})")
+    else:
+        st.warning("Error fetching VarSome data or variant not found.")
 
 
 # Function to render summary data page
@@ -59,145 +206,157 @@ def render_page2():
 
     # Using HTML entity to represent a colon (&#58;)
     # Common user input for both buttons
-    # Input for the search term
-    search_term = st.text_input("Enter variant in HGVS nomenclature e.g. NM_000516.7&#58;c.601C>T:")
+    # Input for the search term and button to trigger the search, in a form so typing does not rerun the page
+    with st.form("summary_data"):
+        search_term = st.text_input("Enter variant in HGVS nomenclature e.g. NM_000516.7&#58;c.601C>T:", _last_term("p2_last"), key="summary_input")
+        submitted = st.form_submit_button("Get summary data")
 
-    # Button to trigger the search
-    if st.button("Get summary data"):
+    if submitted:
         # Check if the search term is not empty
         if search_term:
-            # Call the Ensembl function with the search term
-            ensembl_data = get_ensembl_rest_data(search_term)
-            genomic_coordinates = get_genomic_coordinates(search_term)
-
-            # Call the ClinVar function with the search term
-            clinvar_data = get_clinvar_classification(search_term)
-
-            # Call the VarSome function with the search term
-            varsome_url = get_varsome_data_url(search_term)
-
-            # Display the results
-            st.subheader("Ensembl")
-            if ensembl_data:
-                for key, value in ensembl_data.items():
-                    st.write(f"{key}: {value}")
-            else:
-                st.warning("Not enough information in the Ensembl response or structure is not as expected.")
-            if genomic_coordinates:
-                st.write("GRCh38 Genomic Coordinates: " f"{genomic_coordinates.get('Chromosome', 'N/A')}-{genomic_coordinates.get('Start', 'N/A')}-{genomic_coordinates.get('VariantChange', 'N/A')}")
-            else:
-                st.warning("Not enough information in the genomic coordinates response or structure is not as expected.")
-
-
-            st.subheader("ClinVar Classification")
-            if clinvar_data:
-                clinical_significance, review_status, link = clinvar_data
-                st.write(f"Clinical Significance: {clinical_significance}")
-                st.write(f"Review Status: {review_status}")
-                st.write(f"ClinVar Search: {link}")
-            else:
-                st.warning("Clinical significance not found or variant not found in ClinVar.")
-
-            st.subheader("Varsome")
-            if varsome_url:
-                st.markdown(f"[Link to Varsome Classification]({varsome_url})")
-            else:
-                st.warning("Error fetching VarSome data or variant not found.")
+            # Only fetch if this term has not already been looked up (or part of its lookup failed)
+            if _needs_fetch("p2_last", search_term):
+                # Call the Ensembl, ClinVar and VarSome functions with the search term concurrently
+                results, failed = _fetch_concurrently(
+                    (_cached_ensembl, search_term),
+                    (_cached_coordinates, search_term),
+                    (_cached_clinvar, search_term),
+                    (_cached_varsome, search_term)
+                )
+                st.session_state["p2_last"] = (search_term, results, failed)
         else:
             st.warning("Please enter a search term.")
 
+    # Display the results, which are kept in the session state across reruns
+    results = _last_lookup("p2_last", search_term) if search_term else None
+    if results is not None:
+        _render_summary(*results)
+
+
+# Display the in silico prediction results
+def _render_in_silico(splice_ai_data, revel_result, ensembl_functional_data):
+    # Display SpliceAI data
+    if splice_ai_data is not None:
+        splice_ai_scores = {
+            "Acceptor Gain": splice_ai_data['scores'][0]['DS_AG'],
+            "Acceptor Loss": splice_ai_data['scores'][0]['DS_AL'],
+            "Donor Gain": splice_ai_data['scores'][0]['DS_DG'],
+            "Donor Loss": splice_ai_data['scores'][0]['DS_DL']
+        }
+        st.write("SpliceAI Scores:")
+        st.table(splice_ai_scores)
+    else:
+        st.write("Error retrieving SpliceAI data.")
+
+    # Display Revel data
+    if revel_result:
+        display_data = {
+            "Ensemble_geneid": [revel_result.ensembl_geneid],
+            "Ensemble_transcriptid": [revel_result.ensembl_transcriptid],
+            "REVEL_score": [revel_result.revel_score],
+            "REVEL_rankscore": [revel_result.revel_rankscore]
+        }
+        st.write("REVEL:")
+        st.table(display_data)
+    else:
+        st.write("No search results found for Revel.")
+    
+    # Display Ensembl data
+    st.subheader("Ensembl")
+    if ensembl_functional_data:
+        st.json(ensembl_functional_data)
+    else:
+        st.warning("Not enough information in the Ensembl response or structure is not as expected.")
+
 
 # Function to render in silico predictions page
 def render_page3():
     st.title("In Silico Predictions")
     st.write(" ")
 
-    # Common user input for both functions
-    user_input = st.text_input("Example variant format: 8-140300616-T-G", "Enter variant", key="combined_input")
-
-    # Button to trigger both functions
-    if st.button("Get SpliceAI and Revel Data"):
-        st.write("Processing...")
-
-        # Call the spliceAI function to retrieve the data
-        splice_ai_data = get_splice_ai_data(user_input)
-
-        # Display SpliceAI data
-        if splice_ai_data is not None:
-            splice_ai_scores = {
-                "Acceptor Gain": splice_ai_data['scores'][0]['DS_AG'],
-                "Acceptor Loss": splice_ai_data['scores'][0]['DS_AL'],
-                "Donor Gain": splice_ai_data['scores'][0]['DS_DG'],
-                "Donor Loss": splice_ai_data['scores'][0]['DS_DL']
-            }
-            st.write("SpliceAI Scores:")
-            st.table(splice_ai_scores)
-        else:
-            st.write("Error retrieving SpliceAI data.")
-
-        # Call the Revel function to retrieve the data
-        revel_result = get_revel_score(user_input)
-
-        # Display Revel data
-        if revel_result:
-            display_data = {
-                "Ensemble_geneid": [revel_result.get("Ensembl_geneid", "")],
-                "Ensemble_transcriptid": [revel_result.get("Ensembl_transcriptid", "")],
-                "REVEL_score": [revel_result.get("REVEL_score", "")],
-                "REVEL_rankscore": [revel_result.get("REVEL_rankscore", "")]
-            }
-            st.write("REVEL:")
-            st.table(display_data)
-        else:
-            st.write("No search results found for Revel.")
-        
-        # Ensembl data
-        ensembl_functional_data = get_ensembl_functional_data(user_input)
-        st.subheader("Ensembl")
-        if ensembl_functional_data:
-            for key, value in ensembl_functional_data.items():
-                st.write(f"{key}: {value}")
-        else:
-            st.warning("Not enough information in the Ensembl response or structure is not as expected.")
+    # Common user input and button to trigger both functions, in a form so typing does not rerun the page
+    with st.form("in_silico"):
+        user_input = st.text_input("Example variant format: 8-140300616-T-G", _last_term("p3_last", "Enter variant"), key="combined_input")
+        submitted = st.form_submit_button("Get SpliceAI and Revel Data")
 
-# Function to render case data page
-def render_page4():
-    st.title("Control/Case Frequency")
-    st.write(" ")
+    if submitted:
+        # Only fetch if this variant has not already been looked up (or part of its lookup failed)
+        if _needs_fetch("p3_last", user_input):
+            st.write("Processing...")
+
+            # Call the SpliceAI, Revel and Ensembl functions to retrieve the data concurrently
+            results, failed = _fetch_concurrently(
+                (_cached_splice_ai, user_input),
+                (_cached_revel, user_input),
+                (_cached_ensembl_functional, user_input)
+            )
+            st.session_state["p3_last"] = (user_input, results, failed)
+
+    # Display the results, which are kept in the session state across reruns
+    results = _last_lookup("p3_last", user_input)
+    if results is not None:
+        _render_in_silico(*results)
+
+# Display the allele count, allele number and allele frequency for one GnomAD dataset
+def _allele_metrics(data):
+    if not data:
+        st.write("No data.")
+        return
+
+    # Calculate allele frequency
+    allele_frequency = data['ac'] / data['an'] if data['an'] != 0 else None
+
+    col1, col2, col3 = st.columns(3)
+    col1.metric("AC", data['ac'])
+    col2.metric("AN", data['an'])
+    col3.metric("AF", f"{allele_frequency:.3e}" if allele_frequency is not None else "N/A")
 
-    # GnomAD
-    st.header("GnomAD")
-    hgvs_variant = st.text_input("Enter variant in HGVS nomenclature e.g. NM_000516.7&#58;c.601C>T:")
 
-    if st.button("Search GnomAD"):
-        if hgvs_variant:
-            # Call the combined function
-            result = get_gnomad_data(hgvs_variant)
+# Display the GnomAD results
+def _render_gnomad(result):
+    formatted_variant, genome_data, exome_data = result
 
-            if result:
-                formatted_variant, genome_data, exome_data = result
+    # Display results
+    st.subheader("Results:")
+    st.write("Formatted Variant for GnomAD Search:", formatted_variant)
 
-                # Calculate allele frequency
-                genome_data['allele_frequency'] = genome_data['ac'] / genome_data['an'] if genome_data['an'] != 0 else None
-                exome_data['allele_frequency'] = exome_data['ac'] / exome_data['an'] if exome_data['an'] != 0 else None
+    st.subheader("GnomAD Genome Data:")
+    _allele_metrics(genome_data)
 
-                # Create dataframes
-                genome_df = pd.DataFrame([genome_data])
-                exome_df = pd.DataFrame([exome_data])
+    st.subheader("GnomAD Exome Data:")
+    _allele_metrics(exome_data)
 
-                # Display results with tabulate
-                st.subheader("Results:")
-                st.write("Formatted Variant for GnomAD Search:", formatted_variant)
+    # Add GnomAD link
+    gnomad_link = f"https://gnomad.broadinstitute.org/variant/{formatted_variant}"
+    st.write(f"GnomAD Link: [{formatted_variant}]({gnomad_link})")
 
-                st.subheader("GnomAD Genome Data:")
-                st.text(tabulate(genome_df, headers='keys', tablefmt='pretty', showindex=False))
 
-                st.subheader("GnomAD Exome Data:")
-                st.text(tabulate(exome_df, headers='keys', tablefmt='pretty', showindex=False))
+# Function to render case data page
+def render_page4():
+    st.title("Control/Case Frequency")
+    st.write(" ")
 
-                # Add GnomAD link
-                gnomad_link = f"https://gnomad.broadinstitute.org/variant/{formatted_variant}"
-                st.write(f"GnomAD Link: [{formatted_variant}]({gnomad_link})")
+    # GnomAD
+    st.header("GnomAD")
+    with st.form("gnomad"):
+        hgvs_variant = st.text_input("Enter variant in HGVS nomenclature e.g. NM_000516.7&#58;c.601C>T:", _last_term("p4_last"), key="gnomad_input")
+        submitted = st.form_submit_button("Search GnomAD")
+
+    if submitted:
+        # Only fetch if this variant has not already been looked up successfully
+        if hgvs_variant and _needs_fetch("p4_last", hgvs_variant):
+            # Call the combined function; a failed VEP request exits, so SystemExit is reported as well
+            try:
+                result, failed = _cached_gnomad(hgvs_variant), False
+            except (Exception, SystemExit) as error:
+                st.error(f"Lookup failed: {error}")
+                result, failed = None, True
+            st.session_state["p4_last"] = (hgvs_variant, result, failed)
+
+    # Display the results, which are kept in the session state across reruns
+    result = _last_lookup("p4_last", hgvs_variant) if hgvs_variant else None
+    if result:
+        _render_gnomad(result)
 
 # Function to render literature page
 def render_page5():
@@ -205,15 +364,18 @@ def render_page5():
     st.write("This is the content of Page 5.")
 
     st.header("PubMed")
-    third_user_input = st.text_input("Search any variant or disease association in PubMed", "Search")
-
-    if st.button("Search Pubmed"):
-        if third_user_input:
-            st.write("Searching Pubmed...")
-            pubmed_results = search_pubmed(third_user_input)
+    with st.form("pubmed"):
+        third_user_input = st.text_input("Search any variant or disease association in PubMed", "Search")
+        submitted = st.form_submit_button("Search Pubmed")
+
+    if submitted:
+        # Strip surrounding whitespace so whitespace-only input is rejected and trivially different queries share a cache entry
+        query = third_user_input.strip()
+        if query:
+            pubmed_results = _cached_pubmed(query)
             if pubmed_results:
-                for result in pubmed_results:
-                    st.markdown(result, unsafe_allow_html=True)
+                # Show all results in one markdown element, one paragraph per result
+                st.markdown("\n\n".join(pubmed_results), unsafe_allow_html=True)
             else:
                 st.write("No search results found.")
         else:
@@ -224,100 +386,34 @@ def render_page6():
     st.title("Training cases")
     st.write("Cases to practice somatic variant interpretation following current guidelines.")
 
-    # Read the first image as binary data
-    with open('./TNGS_case1.png', 'rb') as f1:
-        image_data1 = f1.read()
-
-    # Encode the first image to base64
-    image_base64_1 = base64.b64encode(image_data1).decode()
-
-    # Use the encoded first image in the HTML
-    st.markdown(f"""
-        <div style='background-color: #001f3f; padding: 10px; border-radius: 5px; text-align: center;'>
-            <p style='color: #ffffff;'>
-                Case 1:<br>
-                New diagnosis of acute myeloid leukaemia. Custom NGS panel revealed a variant.
-            </p>
-            <img src='data:image/png;base64,{image_base64_1}' alt='Image Alt Text' width='70%' style='margin: 0 auto;'/>
-        </div>
-    """, unsafe_allow_html=True)
-
-    st.markdown("<br>", unsafe_allow_html=True)
-
-    # Read the second image as binary data
-    with open('./TNGS_case2.png', 'rb') as f2:
-        image_data2 = f2.read()
-
-    # Encode the second image to base64
-    image_base64_2 = base64.b64encode(image_data2).decode()
-
-    # Use the encoded second image in the HTML
-    st.markdown(f"""
-        <div style='background-color: #001f3f; padding: 10px; border-radius: 5px; text-align: center;'>
-            <p style='color: #ffffff;'>
-                Case 2:<br>
-                Diagnosis of moderately differentiated colorectal adenocarcinoma with suspected liver metastases seen on imaging.
-            </p>
-            <img src='data:image/png;base64,{image_base64_2}' alt='Image Alt Text' width='70%' style='margin: 0 auto;'/>
-        </div>
-    """, unsafe_allow_html=True)
-
-    st.markdown("<br>", unsafe_allow_html=True)
-
-    # Read the third image as binary data
-    with open('./TNGS_case3.png', 'rb') as f3:
-        image_data3 = f3.read()
-
-    # Encode the third image to base64
-    image_base64_3 = base64.b64encode(image_data3).decode()
-
-    # Use the encoded third image in the HTML
-    st.markdown(f"""
-    <div style='background-color: #001f3f; padding: 10px; border-radius: 5px; text-align: center;'>
-        <p style='color: #ffffff;'>
-            Case 3:<br>
-            Mucinous carcinoma involving both ovaries. Fallopian tube surface involvement present. Metastatic adenocarcinoma to omentum (56mm deposit).
-        </p>
-        <img src='data:image/png;base64,{image_base64_3}' alt='Image Alt Text' width='70%' style='margin: 0 auto;'/>
-    </div>
-""", unsafe_allow_html=True)
-
-
+    # Show each case description with its image. st.image serves the image from Streamlit's media
+    # endpoint, so the browser can cache it instead of receiving it inline on every rerun.
+    for number, (path, caption) in enumerate(CASES, start=1):
+        with st.container():
+            st.markdown(_CASE_TEMPLATE.format(number=number, caption=caption), unsafe_allow_html=True)
+            _, image_col, _ = st.columns([0.15, 0.7, 0.15])
+            image_col.image(_read_image(path))
 
     # Checkbox to toggle visibility
     show_text = st.checkbox("Show Answers")
 
     # Hidden text box
     if show_text:
-        st.markdown(f"""
-            <div style='background-color: #f2f2f2; padding: 10px; border-radius: 5px; color: #000000;'>
-                <p>Case 1:<br>
-                Answer:<br><br>
-                Case 2:<br>
-                Answer:<br><br>
-                Case 3:<br>
-                Answer:</p>
-            </div>
-        """, unsafe_allow_html=True)
-
-
-# Create a dictionary mapping page names to corresponding functions
-pages = {
-    "Somatic Variant Interpretation Dashboard": render_page1,
-    "Summary Data": render_page2,
-    "In Silico Predictions": render_page3,
-    "Case/Control Frequency": render_page4,
-    "Literature Search": render_page5,
-    "Training cases": render_page6
-}
-
-# Create a sidebar with links to different pages
-selected_page = st.sidebar.selectbox("Select a page", list(pages.keys()))
-st.sidebar.image("SVID_image.png", caption=" ", width=250)
-
+        st.markdown(_ANSWERS_HTML, unsafe_allow_html=True)
 
-# Render the selected page
-pages[selected_page]()
 
+# Register the pages with Streamlit's navigation, which adds the page links to the sidebar
+_PAGES = (
+    st.Page(render_page1, title="Somatic Variant Interpretation Dashboard", default=True),
+    st.Page(render_page2, title="Summary Data"),
+    st.Page(render_page3, title="In Silico Predictions"),
+    st.Page(render_page4, title="Case/Control Frequency"),
+    st.Page(render_page5, title="Literature Search"),
+    st.Page(render_page6, title="Training cases")
+)
+selected_page = st.navigation(_PAGES)
+st.sidebar.image(_read_image("SVID_image.png"), caption=" ", width=250)
 
 
+# Render only the selected page
+selected_page.run()